@@ -0,0 +1,43 @@
+import glob
+
+import pandas as pd
+
+####################################
+# FUNCTION: Parse Currency Values
+MONEY_COLS = ["Projected Total", "Projected AAV", "QO", "Total Salary", "AAV"]
+
+def _parse_money(value):
+    value = value.strip()
+    return float(value.lstrip("$").replace(",", "")) if value else float("nan")
+
+####################################
+# FUNCTION: Parse Percent Columns
+def _parse_percent(col):
+    # Columns with no values at all are already read as float
+    return col if pd.api.types.is_numeric_dtype(col) else pd.to_numeric(col.str.rstrip("%"), errors="coerce")
+
+####################################
+# FUNCTION: Filter Unused Columns
+def _is_used_col(col):
+    # playerid is never shown, and trailing commas in some exports add empty "Unnamed: N" columns
+    return col != "playerid" and not col.startswith("Unnamed")
+
+####################################
+# CONVERT CSVS TO PARQUET
+# Run once whenever a CSV is added or updated: python convert_csvs.py
+def convert_csv(path):
+    # Strip "$" and "," while parsing so money columns are stored as floats
+    money_cols = MONEY_COLS if path.endswith("_contract.csv") else ()
+    converters = {col: _parse_money for col in money_cols}
+    df = pd.read_csv(path, usecols=_is_used_col, converters=converters, encoding="utf-8-sig")
+    df.columns = df.columns.str.strip()  # Standardize column names (pitch exports pad some with spaces)
+    if path.endswith("_pitches.csv"):
+        # Store pitch usage (e.g. "4S%") as float percentages
+        usage_cols = [col for col in df.columns if col.endswith("%")]
+        df[usage_cols] = df[usage_cols].apply(_parse_percent)
+    df.to_parquet(path.replace(".csv", ".parquet"), compression="zstd", index=False)
+
+if __name__ == "__main__":
+    for path in sorted(glob.glob("hitters_*.csv") + glob.glob("pitchers_*.csv")):
+        convert_csv(path)
+        print(f"Converted {path}")
@@ -0,0 +1,60 @@
+import streamlit as st
+import pandas as pd
+
+####################################
+# FUNCTION: Categorize Repeated String Columns
+CATEGORY_COLS = ["Name", "Pos", "Bats", "Thr", "Prev Team", "Signing Team"]
+
+def _categorize(df):
+    return df.astype({col: "category" for col in CATEGORY_COLS if col in df.columns})
+
+####################################
+# LOAD DATA
+# Frames are pre-parsed to Parquet by convert_csvs.py
+YEARS = [2022, 2023, 2024, 2025]
+
+def _read(path):
+    df = _categorize(pd.read_parquet(path))
+    # Remaining text columns use Arrow-backed strings instead of Python objects
+    return df.astype({col: "string[pyarrow]" for col in df.select_dtypes(include=["object", "string"]).columns})
+
+@st.cache_data
+def load_data():
+    data = {"hitters": {}, "pitchers": {}}
+    
+    for year in YEARS:
+        # Load hitters' data
+        data["hitters"][year] = {
+            "performance": _read(f"hitters_{year - 2000}.parquet"),
+            "contract": _read(f"hitters_{year - 2000}_contract.parquet"),
+        }
+        
+        # Load pitchers' data
+        data["pitchers"][year] = {
+            "performance": _read(f"pitchers_{year - 2000}.parquet"),
+            "contract": _read(f"pitchers_{year - 2000}_contract.parquet"),
+        }
+
+    # Combine all years per data type once, tagged with a Year column for filtering.
+    # Categories differ between years, so re-categorize after the concat.
+    for player_type in data:
+        data[player_type]["all"] = {
+            data_type: _categorize(pd.concat([data[player_type][year][data_type].assign(Year=year) for year in YEARS], copy=False, ignore_index=True))
+            for data_type in ["performance", "contract"]
+        }
+
+    return data
+
+####################################
+# LOAD PITCH DATA
+# Only needed by the Pitchers views, so loaded separately on first use
+@st.cache_data
+def load_pitches():
+    pitches = {year: _read(f"pitchers_{year - 2000}_pitches.parquet") for year in YEARS}
+
+    # Index the combined pitch data by Name for per-pitcher lookups
+    pitches["all"] = _categorize(
+        pd.concat([pitches[year].assign(Year=year) for year in YEARS], copy=False, ignore_index=True)
+    ).set_index("Name")
+
+    return pitches
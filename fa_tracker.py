@@ -2,39 +2,44 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 
-####################################
-# LOAD CSVS
-@st.cache_data
-def load_data():
-    years = [22, 23, 24, 25]
-    data = {"hitters": {}, "pitchers": {}}
-    
-    for year in years:
-        # Load hitters' data
-        data["hitters"][year] = {
-            "performance": pd.read_csv(f"hitters_{year}.csv").drop(columns=["playerid"], errors="ignore"),
-            "contract": pd.read_csv(f"hitters_{year}_contract.csv").drop(columns=["playerid"], errors="ignore"),
-        }
-        
-        # Load pitchers' data
-        data["pitchers"][year] = {
-            "performance": pd.read_csv(f"pitchers_{year}.csv").drop(columns=["playerid"], errors="ignore"),
-            "contract": pd.read_csv(f"pitchers_{year}_contract.csv").drop(columns=["playerid"], errors="ignore"),
-            "pitches": pd.read_csv(f"pitchers_{year}_pitches.csv").drop(columns=["playerid"], errors="ignore"),
-        }
-
-    return data
+from data_loader import load_data, load_pitches
 
 data = load_data()
 
 ####################################
-# FUNCTION: Convert Currency Columns
-def convert_currency_columns(df):
-    for col in df.columns:
-        if df[col].dtype == "object":  # Only check string columns
-            if df[col].str.startswith("$").any():  # Check if any value starts with "$"
-                df[col] = df[col].replace('[\$,]', '', regex=True).astype(float)
-    return df
+# FUNCTION: Select Years in Selection Order
+def _select_years(df, years):
+    # Keep rows grouped in the order the years were selected, not calendar order
+    years = list(years)
+    rows = df[df["Year"].isin(years)]
+    return rows.sort_values("Year", key=lambda s: s.map(years.index), kind="stable")
+
+####################################
+# FUNCTION: Reshape Pitch Data
+PITCH_METRICS = {"Usage%": "{}%", "Velo": "v{}", "Value": "w{}", "Stf+": "Stf+ {}"}
+
+def _pitch_summary(pitch_df, pitch_types):
+    # pitch_df is indexed by Name, like load_pitches()["all"]
+    # Map each wide column (e.g. "v4S") to its (metric, pitch type) pair
+    col_map = {
+        fmt.format(pitch): (metric, pitch)
+        for metric, fmt in PITCH_METRICS.items()
+        for pitch in pitch_types
+        if fmt.format(pitch) in pitch_df.columns
+    }
+    wide = pitch_df[list(col_map)]
+    wide = wide[~wide.index.duplicated()]  # First row wins, i.e. the first selected year for repeat pitchers
+    wide.columns = pd.MultiIndex.from_tuples(col_map.values(), names=["Metric", "Pitch Type"])
+
+    summary = wide.stack("Pitch Type").reset_index().dropna(subset=["Usage%"])
+    summary = summary.sort_values("Pitch Type", key=lambda s: s.map(pitch_types.index), kind="stable")
+    return summary[["Name", "Pitch Type", *PITCH_METRICS]].rename_axis(columns=None)
+
+####################################
+# FUNCTION: Unique Player Names
+@st.cache_data
+def player_names(player_type, years, data_type):
+    return tuple(_select_years(data[player_type]["all"][data_type], years)["Name"].unique())
 
 ####################################
 # SIDEBAR
@@ -70,25 +75,20 @@ if page == "Search & Compare Free Agents":
     player_type = st.radio("Select Player Type", ["Hitters", "Pitchers"], horizontal=True)
     
     data_type = "performance" if mode == "Performance Data" else "contract"
-    dfs = []
-    for year in selected_years:
-        df = data[player_type.lower()][int(str(year)[-2:])][data_type]
-        df = convert_currency_columns(df)  # Convert currency columns
-        dfs.append(df)
-    
-    combined_df = pd.concat(dfs)
+    combined_df = _select_years(data[player_type.lower()]["all"][data_type], selected_years)
     st.markdown(f"### {player_type} {mode} for {', '.join(map(str, selected_years))}")
-    st.data_editor(combined_df, use_container_width=True)
+    st.dataframe(combined_df, use_container_width=True)
 
     # Player Comparison Feature
+    names = player_names(player_type.lower(), tuple(selected_years), data_type)
     selected_players = st.multiselect(
         "Select Players to Compare (Up to 5)", 
-        combined_df["Name"].unique(), 
-        default=combined_df["Name"].unique()[:2],
+        names, 
+        default=names[:2],
         max_selections=5
     )
 
-    if player_type == "Pitchers":
+    if player_type == "Pitchers" and selected_players:
         st.markdown("### Pitch Type Usage & Performance")
 
         pitch_types = ["4S", "CT", "2S", "CH", "SL", "CB", "SPLT", "KCB", "XX"]
@@ -104,46 +104,23 @@ if page == "Search & Compare Free Agents":
             "XX": "gray"
         }
 
-        selected_pitch_data = []
-        for year in selected_years:
-            pitch_df = data["pitchers"][int(str(year)[-2:])]["pitches"]
-            pitch_df = convert_currency_columns(pitch_df)
-            pitch_df.columns = pitch_df.columns.str.strip()  # Standardize column names
-            selected_pitch_data.append(pitch_df)
-
-        selected_pitch_data = pd.concat(selected_pitch_data)
-        selected_pitch_data = selected_pitch_data[selected_pitch_data["Name"].isin(selected_players)]
+        all_pitches = load_pitches()["all"]
+        selected_pitch_data = _select_years(all_pitches[all_pitches.index.isin(selected_players)], selected_years)
         
         if not selected_pitch_data.empty:
+            pitch_summaries = _pitch_summary(selected_pitch_data, pitch_types)
             for pitcher in selected_players:
                 st.markdown(f"#### {pitcher}'s Pitch Usage")  # Keep only this title
 
-                pitcher_data = selected_pitch_data[selected_pitch_data["Name"] == pitcher]
-                if pitcher_data.empty:
+                if pitcher not in selected_pitch_data.index:
                     st.warning(f"No pitch data available for {pitcher}.")
                     continue
 
-                # Extract pitch data
-                pitch_usage = {pitch: pitcher_data[f"{pitch}%"].values[0] for pitch in pitch_types if f"{pitch}%" in pitcher_data.columns}
-                pitch_velo = {pitch: pitcher_data[f"v{pitch}"].values[0] for pitch in pitch_types if f"v{pitch}" in pitcher_data.columns}
-                pitch_value = {pitch: pitcher_data[f"w{pitch}"].values[0] for pitch in pitch_types if f"w{pitch}" in pitcher_data.columns}
-                pitch_stuff = {pitch: pitcher_data[f"Stf+ {pitch}"].values[0] for pitch in pitch_types if f"Stf+ {pitch}" in pitcher_data.columns}
-
-                # Convert usage % to float
-                pitch_usage = {k: float(str(v).replace("%", "").strip()) for k, v in pitch_usage.items() if isinstance(v, str) and "%" in v and str(v).replace("%", "").replace(".", "").isdigit()}
-
-                if not pitch_usage:
+                pitch_summary = pitch_summaries[pitch_summaries["Name"] == pitcher]
+                if pitch_summary.empty:
                     st.warning(f"No valid pitch usage data available for {pitcher}.")
                     continue
 
-                pitch_summary = pd.DataFrame({
-                    "Pitch Type": list(pitch_usage.keys()),
-                    "Usage%": list(pitch_usage.values()),
-                    "Velo": [pitch_velo.get(k, None) for k in pitch_usage.keys()],
-                    "Value": [pitch_value.get(k, None) for k in pitch_usage.keys()],
-                    "Stf+": [pitch_stuff.get(k, None) for k in pitch_usage.keys()]
-                })
-
                 # Add color mapping for consistent pitch colors
                 color_scale = alt.Scale(domain=list(pitch_colors.keys()), range=list(pitch_colors.values()))
 
@@ -177,17 +154,14 @@ elif page == "2025 Free Agents":
     mode = st.radio("View Data Type", ["Performance Data", "Contract Data"], horizontal=True)
     data_type = "performance" if mode == "Performance Data" else "contract"
     
-    hitters_2025 = data["hitters"][25][data_type]
-    pitchers_2025 = data["pitchers"][25][data_type]
-    
-    hitters_2025 = convert_currency_columns(hitters_2025)
-    pitchers_2025 = convert_currency_columns(pitchers_2025)
+    hitters_2025 = data["hitters"][2025][data_type]
+    pitchers_2025 = data["pitchers"][2025][data_type]
     
     st.markdown("### Hitters")
-    st.data_editor(hitters_2025, use_container_width=True)
+    st.dataframe(hitters_2025, use_container_width=True)
     
     st.markdown("### Pitchers")
-    st.data_editor(pitchers_2025, use_container_width=True)
+    st.dataframe(pitchers_2025, use_container_width=True)
 
 ####################################
 # TOP LEADERS
@@ -198,11 +172,9 @@ elif page == "Top Leaders":
     player_type = st.radio("Select Player Type", ["Hitters", "Pitchers"], horizontal=True)
     
     data_type = st.radio("View Data Type", ["Performance Data", "Contract Data"], horizontal=True)
-    df = data[player_type.lower()][int(str(selected_year)[-2:])][
+    df = data[player_type.lower()][selected_year][
         "performance" if data_type == "Performance Data" else "contract"
     ]
-    
-    df = convert_currency_columns(df)  # Convert currency columns
 
     selected_stat = st.selectbox(
         "Select a Stat",
@@ -210,11 +182,13 @@ elif page == "Top Leaders":
         index=df.columns[1:].tolist().index("WAR") if "WAR" in df.columns[1:] else 0
     )
     
-    top_leaders = df.sort_values(by=selected_stat, ascending=False).head(10)
-    st.data_editor(top_leaders, use_container_width=True)
+    if pd.api.types.is_numeric_dtype(df[selected_stat]):
+        top_leaders = df.nlargest(10, selected_stat)
+    else:  # nlargest only supports numeric columns
+        top_leaders = df.sort_values(by=selected_stat, ascending=False).head(10)
+    st.dataframe(top_leaders, use_container_width=True)
     
     if data_type == "Performance Data" and player_type == "Pitchers":
         st.markdown("### Pitch Type Usage & Performance")
-        pitch_df = data["pitchers"][int(str(selected_year)[-2:])]["pitches"]
-        pitch_df = convert_currency_columns(pitch_df)
-        st.data_editor(pitch_df, use_container_width=True)
+        pitch_df = load_pitches()[selected_year]
+        st.dataframe(pitch_df, use_container_width=True)